@@ -1,10 +1,17 @@
 import os
+import re
+import html
+import json
 import cloudscraper
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from pyairtable import Api
+from pyairtable.formulas import EQ, OR, Field, REGEX_REPLACE, TRIM
 from urllib.parse import urljoin, urlparse
 import logging
-from datetime import datetime
+import hashlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
 import time
 
 # --- Airtable Configuration ---
@@ -19,6 +26,9 @@ FIELD_ARTICLE_URL = "fldUo3r63Cnh6exMR"
 
 AIRTABLE_ARTICLE_URL_COLUMN_NAME = "articleURL"
 
+# Airtable accepts at most 10 records per create request.
+AIRTABLE_BATCH_SIZE = 10
+
 # --- URLs and Headers ---
 BASE_URL = "https://www.insead.edu"
 AJAX_URL = "https://www.insead.edu/views/ajax"
@@ -34,81 +44,310 @@ HEADERS = {
     "https://www.insead.edu/newsroom/news?sort_by=field_publishing_date&sort_order=DESC&search_api_fulltext=",
 }
 
+# Static part of the AJAX query; only "page" changes between requests.
+AJAX_BASE_PARAMS = {
+    "_wrapper_format":
+    "drupal_ajax",
+    "view_name":
+    "insead_stories",
+    "view_display_id":
+    "insead_stories",
+    "view_args":
+    "",
+    "view_path":
+    "/node/116796",
+    "view_base_path":
+    "",
+    "view_dom_id":
+    "564c33262573b6ee5ad8d0673ea91d3d6b9012a98daa9de483dd48f5bcd240c0",
+    "pager_element":
+    0,
+    "_drupal_ajax":
+    1,
+    "ajax_page_state[theme]":
+    "insead_core",
+    "ajax_page_state[theme_token]":
+    "",
+    "ajax_page_state[libraries]":
+    "eJx9Vu2WgygMfSGp77F_9wE4AVJlisSF2I7z9BvFflhpz5kzxXuvIMlNwIC9aCb5G1vzHOuf3JgPFOMvNwaZMWn8HSmj02cf5DG3MIkoT2bwHyUdRkwQGhPgb26NpxP8wG9jKVAy9Ns6PMMUuME_S5ExssbBoGvfnrXN-UXDPQ7YnqcQ1M077pXp1PLRXaIpuuYMFjm3Lk0jhFN5Otke7UWWXN7okOsil2h0dItfRfc9Vcmrx1tW6yYLoh0w6gSxw3YZqnXYnCkN7Mfc3geNj9lpiBBm9ja366OBKGtpS8NIUXZeFdkLOs-UdPDxkjVeRVifTnKJSSBRZvax0_eAfl-gzMtJIiwvVSUZIdn-u2Yl787YFLRxMhC5H4A9xY1L8mrANnMij69xbLavMgnS3L4-nGwQ-2kzMVPUveyS0vxFvrerznO0X9RdIAPhn_xFwjdEBhNQrYXzWVgMlseEcMG0Fya0kop_15AWZoQEXYKxz89UbZGrUqcoLtSZEm9bK9Pc0Cx20xjovwna8qNek4YgfqKELVj5cVsynqgTpwkIQa2m2JHFrHuIJBGDqjAWklODGBc-wKpL3h05Mj9o-YhL0PdgcfY21yLJVT4z8J5ZfHYAlI_jtF_23rpesVLye4iI3_ZeIPm0ONXwKyQP8mmSyh1d7LeDehjMlLraZL2MvkwmpdZVkNW2j5e4T_gmipJ3PK52wbkSysUj0kqlQUNKdHvjMteyWRLm7ZvzBuzguOwClAWO-xnIvUVrkHR59SyIBzHKu29IAB9rvh0TSbUNA8o80X0kI1x992hmD0HCjCwngBTWDi_ts5hMLSX6xtplJsWepbFY3pdMHkDOwcXhe5islzI9hGxpidJOa2FYu6X6VGZy0K-zqbCvNKm8fdbZD7i4pAoeP_TB9PJhf1KWb1l78FdcTgTZ07pigJkmllbvg6ShXa0q1wq9BevA36jCOp8tybxzK_UhfEPmPGW7nDQ4gA-PIn922ft5_0ROk6TNiJ97dM12EMLo9XI9WlpyQL5n-IA3JU16dX05aKUNSAxumGnA0_NgrgiP0Gm9GTV5zoyDNOSMzdU7pO0WdfYYXHu_fFUo8acsl_1Vor2QzXqdadf_JymoKWCBtI_ify9xyjZRCEWi7qgq6P833RZ2"
+}
+
+# Insert targets that hold the view's cards, most specific first. Any other
+# insert command is only used when none of these is present.
+INSERT_SELECTORS = (
+    f".js-view-dom-id-{AJAX_BASE_PARAMS['view_dom_id']}",
+    ".view-content",
+)
+INSERT_SELECTOR_PRIORITY = {
+    selector: priority
+    for priority, selector in enumerate(INSERT_SELECTORS)
+}
+
+# --- Card Patterns ---
+# Each listing card only needs a link, an image and a date, so cards are read
+# with precompiled regexes and only parsed into a tree when one of them misses.
+# The patterns are only ever run over a single card's own <div> element.
+# Card boundaries are found by tokenizing tags, so "<div" inside comments,
+# scripts, styles or quoted attribute values is not counted.
+TAG_TOKEN_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style)\b.*?</\1\s*>'
+    r'|(</div\s*>)'
+    r'|(<div\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)'
+    r'|</?[a-zA-Z][^\s/>]*(?:[^>"\']|"[^"]*"|\'[^\']*\')*>',
+    re.DOTALL | re.IGNORECASE)
+CARD_CLASS_RE = re.compile(
+    r'\sclass="(?:[^"]*\s)?story-card-object(?:\s[^"]*)?"')
+LINK_RE = re.compile(
+    r'<h3[^>]+class="[^"]*\blist-object__heading\b[^"]*"[^>]*>'
+    r'(?:(?!</h3>)[\s\S])*?'
+    r'<a(?=[^>]*\sclass="[^"]*\bh3__link\b)(?=[^>]*\shref="([^"]+)")[^>]*>'
+    r'([^<]+)</a>')
+IMG_TAG_RE = re.compile(
+    r'<a(?=[^>]*\sclass="[^"]*\blink--image-overlay\b)[^>]*>'
+    r'(?:(?!</a>)[\s\S])*?(<img\b[^>]*>)')
+IMG_SRC_RE = re.compile(r'\ssrc="([^"]+)"')
+IMG_DATA_SRC_RE = re.compile(r'\sdata-src="([^"]+)"')
+DATE_RE = re.compile(r'<time[^>]+datetime="([^"]+)"')
+# Scheme, query, fragment and trailing slashes are ignored when comparing
+# scraped URLs with stored ones; the same rules run inside the Airtable
+# formula in fetch_known_url_hashes.
+URL_KEY_TAIL_PATTERN = r'[?#].*$'
+URL_KEY_EDGES_PATTERN = r'^https?://|/+$'
+URL_KEY_TAIL_RE = re.compile(URL_KEY_TAIL_PATTERN, re.DOTALL)
+URL_KEY_EDGES_RE = re.compile(URL_KEY_EDGES_PATTERN)
+# Drupal wraps AJAX JSON in an HTML-escaped <textarea> for some requests.
+TEXTAREA_RE = re.compile(r'<textarea[^>]*>(.*?)</textarea>', re.DOTALL)
+
 # --- Logging Setup ---
+# Debug output is opt-in: set INSEAD_DEBUG=1 to enable it.
+LOG_LEVEL = logging.DEBUG if os.getenv("INSEAD_DEBUG") == "1" else logging.INFO
 logging.basicConfig(filename='insead_ajax_scraper.log',
                     filemode='w',
-                    level=logging.DEBUG,
+                    level=LOG_LEVEL,
                     format='%(asctime)s [%(levelname)s] %(message)s')
 
 # --- Cloudscraper ---
+# One session for the whole run. Page 0 is fetched on the main thread before
+# any worker starts (see main), so the Cloudflare challenge is solved and its
+# cookies are settled before the session is shared between fetch threads.
 scraper = cloudscraper.create_scraper()
 
+# Only back off when the server asks to; other responses are used right away.
+RETRY_STATUS_CODES = (429, 503)
+MAX_RETRIES = 3
+DEFAULT_RETRY_AFTER = 2
+MAX_RETRY_AFTER = 30
+
 
 # --- Utility ---
 def normalize_url(url):
+    # Fast path for site URLs, which are almost all of them. Like urlparse,
+    # it drops ";params" from the last path segment only.
+    if url.startswith(BASE_URL + "/"):
+        path = url.split("#", 1)[0].split("?", 1)[0]
+        head, sep, last = path.rpartition("/")
+        return f"{head}{sep}{last.split(';', 1)[0]}".rstrip("/")
     parsed = urlparse(url)
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
 
 
-def extract_date_from_tag(tag):
-    if tag and tag.has_attr("datetime"):
-        try:
-            parsed_date = datetime.fromisoformat(tag["datetime"].replace(
-                "Z", "+00:00"))
-            return parsed_date.strftime("%Y-%m-%d")
-        except Exception as e:
-            logging.error(f"[DATE PARSE ERROR] {e}")
-    return None
+def url_hash(url):
+    # 64-bit blake2b prefix: smaller and cheaper to probe than the URL string.
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(),
+                          "little")
+
+
+def format_card_date(datetime_attr):
+    # ISO timestamps already start with the YYYY-MM-DD date Airtable wants;
+    # only that prefix is validated, not the whole timestamp.
+    if not datetime_attr:
+        return None
+
+    date_part = datetime_attr[:10]
+    if date_part[4:5] != "-" or date_part[7:8] != "-":
+        logging.error(f"[DATE PARSE ERROR] Not a YYYY-MM-DD date: "
+                      f"{datetime_attr!r}")
+        return None
+
+    try:
+        date.fromisoformat(date_part)
+    except ValueError as e:
+        logging.error(f"[DATE PARSE ERROR] {e}: {datetime_attr!r}")
+        return None
+    return date_part
+
+
+# --- Card Parsing ---
+def find_card_spans(markup):
+    spans = []
+    depth = 0
+    card_start = None
+    card_depth = None
+    for match in TAG_TOKEN_RE.finditer(markup):
+        if match.group(3):
+            depth += 1
+            if card_start is None and CARD_CLASS_RE.search(match.group(3)):
+                card_start, card_depth = match.start(), depth
+        elif match.group(2):
+            if card_start is not None and depth == card_depth:
+                spans.append((card_start, match.end()))
+                card_start = None
+            depth -= 1
+
+    # An unclosed card means the regex view of the markup can't be trusted.
+    if card_start is not None:
+        return None
+    return spans
+
+
+def card_from_chunk(chunk):
+    link_match = LINK_RE.search(chunk)
+    img_match = IMG_TAG_RE.search(chunk)
+    date_match = DATE_RE.search(chunk)
+    if not (link_match and img_match and date_match):
+        return None
+
+    img_tag = img_match.group(1)
+    src_match = IMG_SRC_RE.search(img_tag) or IMG_DATA_SRC_RE.search(img_tag)
+    if not src_match:
+        return None
+
+    return {
+        "href": html.unescape(link_match.group(1)),
+        "title": html.unescape(link_match.group(2)).strip(),
+        "image_src": html.unescape(src_match.group(1)),
+        "datetime": html.unescape(date_match.group(1)),
+    }
+
+
+def card_from_node(node):
+    link_tag = node.css_first("h3.list-object__heading a.h3__link")
+    image_tag = node.css_first("a.link--image-overlay img")
+    time_tag = node.css_first("time[datetime]")
+
+    image_src = None
+    if image_tag:
+        image_src = (image_tag.attributes.get("src")
+                     or image_tag.attributes.get("data-src"))
+
+    return {
+        "href": link_tag.attributes.get("href") if link_tag else None,
+        "title": link_tag.text(strip=True) if link_tag else "",
+        "image_src": image_src,
+        "datetime": time_tag.attributes.get("datetime") if time_tag else None,
+    }
+
+
+def parse_story_cards(markup):
+    spans = find_card_spans(markup)
+
+    # No cards found or unbalanced markup: let the parser sort it out.
+    if not spans:
+        tree = LexborHTMLParser(markup)
+        return [card_from_node(node)
+                for node in tree.css("div.story-card-object")]
+
+    # With INSEAD_DEBUG=1 every regex result is checked against the parsed
+    # card, so drift between the two paths shows up in the log.
+    verify = logging.getLogger().isEnabledFor(logging.DEBUG)
+    misses = 0
+    cards = []
+    for start, end in spans:
+        chunk = markup[start:end]
+        card = card_from_chunk(chunk)
+        if card is None or verify:
+            node = LexborHTMLParser(chunk).css_first("div.story-card-object")
+            if card is None:
+                misses += 1
+                logging.debug("🔎 Regex miss, parsing card with selectolax")
+                if not node:
+                    continue
+                card = card_from_node(node)
+            elif node:
+                parsed_card = card_from_node(node)
+                if card != parsed_card:
+                    logging.warning(
+                        "⚠️ Regex card differs from parsed card: %r != %r",
+                        card, parsed_card)
+        cards.append(card)
+
+    if misses == len(spans):
+        logging.warning(
+            "⚠️ Card regexes missed all %d cards; the listing markup may "
+            "have changed.", misses)
+    return cards
+
+
+# --- HTTP ---
+def retry_after_seconds(response):
+    try:
+        delay = float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except ValueError:
+        # HTTP-date values are rare here; fall back to the default delay.
+        delay = DEFAULT_RETRY_AFTER
+    return min(max(delay, 0), MAX_RETRY_AFTER)
+
+
+def get_with_backoff(url, **kwargs):
+    for attempt in range(MAX_RETRIES + 1):
+        response = scraper.get(url, **kwargs)
+        if (response.status_code not in RETRY_STATUS_CODES
+                or attempt == MAX_RETRIES):
+            return response
+
+        delay = retry_after_seconds(response)
+        logging.warning(f"⏳ HTTP {response.status_code} from {url}, "
+                        f"retrying in {delay:g}s")
+        time.sleep(delay)
 
 
 # --- AJAX Pagination Function ---
+def select_insert_command(data):
+    best_item = None
+    best_priority = len(INSERT_SELECTORS)
+    for item in data:
+        if item.get("command") != "insert" or "data" not in item:
+            continue
+        priority = INSERT_SELECTOR_PRIORITY.get(item.get("selector"),
+                                                len(INSERT_SELECTORS))
+        if best_item is None or priority < best_priority:
+            best_item, best_priority = item, priority
+            if priority == 0:
+                break
+    return best_item
+
+
+def decode_ajax_response(response):
+    try:
+        return response.json()
+    except ValueError:
+        match = TEXTAREA_RE.search(response.text)
+        if not match:
+            raise
+        logging.debug("📦 Unwrapping AJAX JSON from <textarea>")
+        return json.loads(html.unescape(match.group(1)))
+
+
 def fetch_ajax_page(page_num: int) -> list:
-    logging.debug(f"🌐 Fetching AJAX page {page_num}")
-
-    params = {
-        "_wrapper_format":
-        "drupal_ajax",
-        "view_name":
-        "insead_stories",
-        "view_display_id":
-        "insead_stories",
-        "view_args":
-        "",
-        "view_path":
-        "/node/116796",
-        "view_base_path":
-        "",
-        "view_dom_id":
-        "564c33262573b6ee5ad8d0673ea91d3d6b9012a98daa9de483dd48f5bcd240c0",
-        "pager_element":
-        0,
-        "page":
-        page_num,
-        "_drupal_ajax":
-        1,
-        "ajax_page_state[theme]":
-        "insead_core",
-        "ajax_page_state[theme_token]":
-        "",
-        "ajax_page_state[libraries]":
-        "eJx9Vu2WgygMfSGp77F_9wE4AVJlisSF2I7z9BvFflhpz5kzxXuvIMlNwIC9aCb5G1vzHOuf3JgPFOMvNwaZMWn8HSmj02cf5DG3MIkoT2bwHyUdRkwQGhPgb26NpxP8wG9jKVAy9Ns6PMMUuME_S5ExssbBoGvfnrXN-UXDPQ7YnqcQ1M077pXp1PLRXaIpuuYMFjm3Lk0jhFN5Otke7UWWXN7okOsil2h0dItfRfc9Vcmrx1tW6yYLoh0w6gSxw3YZqnXYnCkN7Mfc3geNj9lpiBBm9ja366OBKGtpS8NIUXZeFdkLOs-UdPDxkjVeRVifTnKJSSBRZvax0_eAfl-gzMtJIiwvVSUZIdn-u2Yl787YFLRxMhC5H4A9xY1L8mrANnMij69xbLavMgnS3L4-nGwQ-2kzMVPUveyS0vxFvrerznO0X9RdIAPhn_xFwjdEBhNQrYXzWVgMlseEcMG0Fya0kop_15AWZoQEXYKxz89UbZGrUqcoLtSZEm9bK9Pc0Cx20xjovwna8qNek4YgfqKELVj5cVsynqgTpwkIQa2m2JHFrHuIJBGDqjAWklODGBc-wKpL3h05Mj9o-YhL0PdgcfY21yLJVT4z8J5ZfHYAlI_jtF_23rpesVLye4iI3_ZeIPm0ONXwKyQP8mmSyh1d7LeDehjMlLraZL2MvkwmpdZVkNW2j5e4T_gmipJ3PK52wbkSysUj0kqlQUNKdHvjMteyWRLm7ZvzBuzguOwClAWO-xnIvUVrkHR59SyIBzHKu29IAB9rvh0TSbUNA8o80X0kI1x992hmD0HCjCwngBTWDi_ts5hMLSX6xtplJsWepbFY3pdMHkDOwcXhe5islzI9hGxpidJOa2FYu6X6VGZy0K-zqbCvNKm8fdbZD7i4pAoeP_TB9PJhf1KWb1l78FdcTgTZ07pigJkmllbvg6ShXa0q1wq9BevA36jCOp8tybxzK_UhfEPmPGW7nDQ4gA-PIn922ft5_0ROk6TNiJ97dM12EMLo9XI9WlpyQL5n-IA3JU16dX05aKUNSAxumGnA0_NgrgiP0Gm9GTV5zoyDNOSMzdU7pO0WdfYYXHu_fFUo8acsl_1Vor2QzXqdadf_JymoKWCBtI_ify9xyjZRCEWi7qgq6P833RZ2"
-    }
+    logging.debug("🌐 Fetching AJAX page %s", page_num)
+
+    params = AJAX_BASE_PARAMS | {"page": page_num}
 
     try:
-        response = scraper.get(AJAX_URL,
-                               headers=HEADERS,
-                               params=params,
-                               timeout=20)
-        logging.debug(f"📡 Status Code: {response.status_code}")
+        response = get_with_backoff(AJAX_URL,
+                                    headers=HEADERS,
+                                    params=params,
+                                    timeout=20)
+        logging.debug("📡 Status Code: %s", response.status_code)
         response.raise_for_status()
 
-        data = response.json()
-        logging.debug(f"✅ AJAX JSON length: {len(data)}")
+        data = decode_ajax_response(response)
+        logging.debug("✅ AJAX JSON length: %d", len(data))
 
-        for item in data:
-            if item.get("command") == "insert" and "data" in item:
-                soup = BeautifulSoup(item["data"], "html.parser")
-                return soup.select("div.story-card-object")
+        item = select_insert_command(data)
+        if item:
+            return parse_story_cards(item["data"])
 
         logging.warning("⚠️ No 'insert' content block found in AJAX JSON.")
     except Exception as e:
@@ -118,33 +357,105 @@ def fetch_ajax_page(page_num: int) -> list:
     return []
 
 
+# --- Airtable Lookup ---
+def url_match_key(url):
+    return URL_KEY_EDGES_RE.sub("", URL_KEY_TAIL_RE.sub("", url.strip()))
+
+
+def fetch_known_url_hashes(urls, existing_url_hashes, table):
+    # Ask Airtable only about this page's URLs instead of preloading the
+    # whole table; URLs already seen in this run are not asked about again.
+    # Stored values are normalized inside the formula, so rows saved with a
+    # query string, fragment, trailing slash or http:// still match.
+    unknown_urls = [
+        url for url in dict.fromkeys(urls)
+        if url_hash(url) not in existing_url_hashes
+    ]
+    if not unknown_urls:
+        return set()
+
+    stored_key = REGEX_REPLACE(
+        REGEX_REPLACE(TRIM(Field(AIRTABLE_ARTICLE_URL_COLUMN_NAME)),
+                      URL_KEY_TAIL_PATTERN, ""), URL_KEY_EDGES_PATTERN, "")
+    keys_by_url = {url: url_match_key(url) for url in unknown_urls}
+    formula = OR(*(EQ(stored_key, key) for key in set(keys_by_url.values())))
+
+    stored_keys = set()
+    for record in table.all(formula=formula, fields=[FIELD_ARTICLE_URL]):
+        url = record.get("fields", {}).get(AIRTABLE_ARTICLE_URL_COLUMN_NAME)
+        if url:
+            stored_keys.add(url_match_key(url))
+
+    return {
+        url_hash(url)
+        for url, key in keys_by_url.items() if key in stored_keys
+    }
+
+
 # --- Process Articles and Upload ---
-def process_and_add_articles(soup_cards, existing_urls, table):
+def add_records_batch(pending, existing_url_hashes, table):
+    if not pending:
+        return 0
+
+    try:
+        table.batch_create(pending, typecast=False)
+        created = pending
+    except Exception as e:
+        # One bad record fails the whole request, so retry one at a time to
+        # keep the rest of the batch.
+        logging.warning(f"⚠️ Failed to add batch of {len(pending)} articles, "
+                        f"retrying individually: {e}")
+        created = []
+        for fields in pending:
+            try:
+                table.create(fields, typecast=False)
+                created.append(fields)
+            except Exception as e:
+                logging.error(
+                    f"❌ Error adding article "
+                    f"({fields[FIELD_ARTICLE_URL]}): {e}",
+                    exc_info=True)
+
+    for fields in created:
+        existing_url_hashes.add(url_hash(fields[FIELD_ARTICLE_URL]))
+        logging.info("✅ ADDED: %s | %s", fields[FIELD_TITLE],
+                     fields[FIELD_ARTICLE_URL])
+    return len(created)
+
+
+def process_and_add_articles(cards, existing_url_hashes, table):
     added = 0
     skipped = 0
+    pending = []
+    pending_url_hashes = set()
+
+    page_urls = [
+        normalize_url(urljoin(BASE_URL, card["href"])) for card in cards
+        if card["href"]
+    ]
+    existing_url_hashes.update(
+        fetch_known_url_hashes(page_urls, existing_url_hashes, table))
 
-    for card in soup_cards:
+    for card in cards:
         current_article_url = "N/A"
         try:
-            link_tag = card.select_one("h3.list-object__heading a.h3__link")
-            if not link_tag:
+            href = card["href"]
+            if not href:
                 continue
 
-            current_article_url = normalize_url(
-                urljoin(BASE_URL, link_tag['href']))
-            if current_article_url in existing_urls:
+            current_article_url = normalize_url(urljoin(BASE_URL, href))
+            current_url_hash = url_hash(current_article_url)
+            if (current_url_hash in existing_url_hashes
+                    or current_url_hash in pending_url_hashes):
                 skipped += 1
                 continue
 
-            title = link_tag.get_text(strip=True)
+            title = card["title"]
             image_url = ""
-            image_tag = card.select_one("a.link--image-overlay img")
-            if image_tag:
-                image_src = image_tag.get("src") or image_tag.get("data-src")
-                if image_src:
-                    image_url = urljoin(BASE_URL, image_src)
+            if card["image_src"]:
+                image_url = urljoin(BASE_URL, card["image_src"])
 
-            pub_date = extract_date_from_tag(card.select_one("time[datetime]"))
+            pub_date = format_card_date(card["datetime"])
 
             fields = {
                 FIELD_TITLE: title,
@@ -154,15 +465,19 @@ def process_and_add_articles(soup_cards, existing_urls, table):
             if pub_date:
                 fields[FIELD_PUBLICATION_DATE] = pub_date
 
-            table.create(fields)
-            existing_urls.add(current_article_url)
-            added += 1
-            logging.info(f"✅ ADDED: {title} | {current_article_url}")
+            pending.append(fields)
+            pending_url_hashes.add(current_url_hash)
         except Exception as e:
             logging.error(
                 f"❌ Error processing article ({current_article_url}): {e}",
                 exc_info=True)
+            continue
+
+        if len(pending) == AIRTABLE_BATCH_SIZE:
+            added += add_records_batch(pending, existing_url_hashes, table)
+            pending = []
 
+    added += add_records_batch(pending, existing_url_hashes, table)
     return added, skipped
 
 
@@ -170,6 +485,7 @@ def process_and_add_articles(soup_cards, existing_urls, table):
 def main():
     logging.info("🚀 Starting INSEAD AJAX Scraper")
     MAX_PAGES = 10
+    MAX_IN_FLIGHT_PAGES = 4
 
     if not AIRTABLE_API_KEY:
         logging.error("❌ AIRTABLE_API_KEY missing.")
@@ -179,36 +495,75 @@ def main():
     api = Api(AIRTABLE_API_KEY)
     table = api.table(BASE_ID, TABLE_ID)
 
-    existing_urls = set()
-    try:
-        for record in table.all():
-            url = record.get("fields",
-                             {}).get(AIRTABLE_ARTICLE_URL_COLUMN_NAME)
-            if url:
-                existing_urls.add(normalize_url(url))
-        logging.info(
-            f"📦 Loaded {len(existing_urls)} existing URLs from Airtable")
-    except Exception as e:
-        logging.error(f"❌ Failed to load Airtable records: {e}", exc_info=True)
-        return
+    # Filled per page from Airtable lookups and from records added this run.
+    existing_url_hashes: set[int] = set()
 
     total_added = 0
     total_skipped = 0
 
-    for page in range(MAX_PAGES):
-        logging.info(f"🔁 Requesting page {page}")
-        articles = fetch_ajax_page(page)
-        if not articles:
-            logging.info("✅ No more articles found. Ending loop.")
-            break
-        logging.info(f"📄 Found {len(articles)} article cards on page {page}")
+    # Fetch one page at a time until a page turns out to contain new
+    # articles, then keep a bounded window of later pages in flight while
+    # earlier ones are uploaded; results are still consumed in page order.
+    # Starting narrow keeps the common incremental run, which stops on the
+    # first all-duplicate page, down to a single fetch.
+    executor = ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT_PAGES)
+    in_flight = deque()
+    window = 1
+    next_page = 0
+
+    def fill_window():
+        nonlocal next_page
+        while len(in_flight) < window and next_page < MAX_PAGES:
+            logging.info("🔁 Requesting page %d", next_page)
+            if next_page == 0:
+                # Warm-up on the main thread: cloudscraper mutates the
+                # session while solving a challenge, so that happens before
+                # the session is shared with the pool.
+                future = Future()
+                future.set_result(fetch_ajax_page(0))
+            else:
+                future = executor.submit(fetch_ajax_page, next_page)
+            in_flight.append(future)
+            next_page += 1
 
-        added, skipped = process_and_add_articles(articles, existing_urls,
-                                                  table)
-        total_added += added
-        total_skipped += skipped
-
-        time.sleep(2)
+    try:
+        fill_window()
+        for page in range(MAX_PAGES):
+            if not in_flight:
+                break
+            articles = in_flight.popleft().result()
+            if not articles:
+                logging.info("✅ No more articles found. Ending loop.")
+                break
+            logging.info("📄 Found %d article cards on page %d",
+                         len(articles), page)
+
+            if window > 1:
+                fill_window()
+
+            try:
+                added, skipped = process_and_add_articles(
+                    articles, existing_url_hashes, table)
+            except Exception as e:
+                logging.error(f"❌ Failed to check Airtable records: {e}",
+                              exc_info=True)
+                break
+            total_added += added
+            total_skipped += skipped
+
+            # The feed is newest-first: once a whole page is already known,
+            # every later page will be too.
+            if added == 0 and skipped == len(articles):
+                logging.info("✅ Page %d is all duplicates. Ending loop.",
+                             page)
+                break
+
+            if added:
+                window = MAX_IN_FLIGHT_PAGES
+            fill_window()
+    finally:
+        # Drop queued fetches rather than waiting on pages we no longer need.
+        executor.shutdown(wait=False, cancel_futures=True)
 
     logging.info(f"🏁 Done. Added: {total_added} | Skipped: {total_skipped}")
     print(f"✅ Done. Added: {total_added}, Skipped: {total_skipped}")